@@ -2,8 +2,8 @@ import argparse
 import subprocess
 
 
-def run(cmd):
-    subprocess.run(cmd, check=True)
+def run(cmd, check=True):
+    return subprocess.run(cmd, check=check, stdin=subprocess.DEVNULL)
 
 
 def main():
@@ -11,18 +11,20 @@ def main():
     parser.add_argument("--repo", default="", help="GitHub repo URL (optional).")
     parser.add_argument("--branch", default="main", help="Branch name (default: main).")
     parser.add_argument("--message", default="Update project", help="Commit message.")
+    parser.add_argument("--verbose", action="store_true", help="Show git status before committing.")
     args = parser.parse_args()
 
     if args.repo:
-        run(["git", "remote", "remove", "origin"])
-        run(["git", "remote", "add", "origin", args.repo])
+        if run(["git", "remote", "set-url", "origin", args.repo], check=False).returncode != 0:
+            run(["git", "remote", "add", "origin", args.repo])
 
-    run(["git", "status", "-sb"])
+    if args.verbose:
+        run(["git", "status", "-sb"])
     run(["git", "add", "-A"])
 
-    try:
+    if run(["git", "diff", "--cached", "--quiet"], check=False).returncode == 1:
         run(["git", "commit", "-m", args.message])
-    except subprocess.CalledProcessError:
+    else:
         print("No changes to commit.")
 
     run(["git", "push", "--set-upstream", "origin", args.branch])